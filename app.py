@@ -6,55 +6,150 @@ The API provides a single endpoint (`/process`) that accepts a JSON payload cont
 generates a badge with the provided name, and returns an HTML fragment of the badge.
 
 Key Features:
-- Implements HTTP Basic Authentication to protect the `/process` endpoint.
+- Implements HTTP Basic Authentication to protect the `/process` endpoint, rejecting
+  unauthenticated requests in WSGI middleware before they reach Flask.
 - Utilizes Flask-RESTx for API documentation and validation.
+- Uses orjson for all JSON parsing and serialization.
 - Generates a badge using an external `badgecreator` module and returns it as part of the response.
+- Serves badges as cacheable PNG images from `/badge/<name>.png`.
 - Logs incoming requests and badge generation activity for debugging purposes.
 
 Classes:
+    OrjsonProvider: Flask JSON provider backed by orjson.
+    BasicAuthMiddleware: WSGI middleware enforcing HTTP Basic Auth on protected paths.
     AgentRequest: Represents an agent request containing a name.
     AgentResponse: Represents a response to the agent with a message.
 
 Endpoints:
     POST /process:
         - Input: JSON payload containing a `name` field.
-        - Output: HTML fragment with a base64-encoded badge or an error message.
+        - Output: HTML fragment with a base64-encoded badge (or SVG badge, or a link to
+          `/badge/<name>.png`) or an error message.
+    GET /badge/<name>.png:
+        - Only served when `BADGE_FORMAT` is `url`; not found otherwise.
+        - Not authenticated, since `<img>` tags cannot send credentials.
+        - Output: The badge for the given name as a PNG image, with HTTP caching headers.
+          Names are limited to 64 characters, like for `/process`.
 
 Usage:
-    - Run the application with `python <filename>.py`.
+    - In production the application is served by Gunicorn, as configured in the `Procfile`.
+    - Run the application locally with `python <filename>.py` (set `FLASK_DEBUG=1` for debug mode).
     - The server listens on the port specified in the `PORT` environment variable or defaults to 5000.
+    - Set the `HEROKU_PASSWORD_HASH` environment variable to a Werkzeug password hash to
+      change the password of the `heroku` user.
+    - Set the `LOGLEVEL` environment variable (e.g. `INFO`) for more verbose logging; the default is `WARNING`.
+    - Set the `BADGE_FORMAT` environment variable to `webp` or `svg` to return WebP or SVG badges
+      instead of PNG, or to `url` to return an image linking to `/badge/<name>.png`.
+    - Set `DEBUG_HTML=1` to save each generated badge to `debug.html`.
     - Use an HTTP client (e.g., Postman, curl) to interact with the `/process` endpoint.
 
 Dependencies:
     - Flask
     - Flask-RESTx
     - Flask-HTTPAuth
+    - Gunicorn (production server)
     - Werkzeug (for password hashing)
+    - cachetools (for caching successful credential checks)
+    - orjson (for fast JSON handling)
+    - pybase64 (for fast Base64 encoding)
     - badgecreator (external module for badge generation)
 """
+import functools
+import hashlib
+import hmac
+import html
 import logging
 import os
+import secrets
+import threading
 
+import orjson
+import pybase64
+from cachetools import TTLCache
 from flask import Flask, jsonify, request, make_response
+from flask.json.provider import JSONProvider
 from flask_httpauth import HTTPBasicAuth
 from flask_restx import Api, Resource, fields
+from werkzeug.datastructures import Authorization
+from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.security import generate_password_hash, check_password_hash
 
-from badgecreator import create_badge
+from badgecreator import (
+    WEBP_SUPPORTED,
+    create_badge,
+    create_badge_svg,
+    render_badge_png,
+    render_badge_webp,
+)
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider that uses orjson instead of the standard library.
+
+    Used by `request.json` and `jsonify`.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 api = Api(app,
           title='Agentforce Action',
           description="Basic Agentforce Action example",
           version='0.1.0'
           )
 
+# Serialize Flask-RESTx resource results with orjson as well
+@api.representation('application/json')
+def output_json(data, code, headers=None):
+    """
+    Makes a Flask response with an orjson-encoded body.
+
+    Parameters:
+        data: The data returned by the resource.
+        code (int): The HTTP status code.
+        headers (dict): Additional response headers.
+
+    Returns:
+        flask.Response: The JSON response.
+    """
+    response = make_response(orjson.dumps(data), code)
+    response.headers.extend(headers or {})
+    return response
+
 auth = HTTPBasicAuth()
 
 # Define a hardcoded user with a hashed password
-users = {
-    "heroku": generate_password_hash("agent")
-}
+@functools.lru_cache(maxsize=1)
+def get_users():
+    """
+    Returns the known users and their password hashes.
+
+    The default password is hashed on first use rather than at import time.
+    Set the `HEROKU_PASSWORD_HASH` environment variable to a Werkzeug password
+    hash to replace the default password and skip hashing it entirely.
+
+    Returns:
+        dict: A mapping of usernames to password hashes.
+    """
+    return {
+        "heroku": os.environ.get("HEROKU_PASSWORD_HASH") or generate_password_hash("agent")
+    }
+
+# Cache of recently verified credentials, mapping a username to an HMAC of its
+# password. Avoids re-running the (deliberately slow) password hash check on
+# every request from the same client. The HMAC key is random per process, so
+# the cached values cannot be checked against guessed passwords elsewhere.
+verified_credentials = TTLCache(maxsize=1024, ttl=300)
+verified_credentials_lock = threading.Lock()
+verified_credentials_key = secrets.token_bytes(32)
 
 # Verify the username and password
 @auth.verify_password
@@ -62,6 +157,9 @@ def verify_password(username, password):
     """
     Verifies a user's credentials using HTTP Basic Auth.
 
+    Successful checks are cached for a few minutes so that repeat requests
+    skip the password hash check.
+
     Parameters:
         username (str): The provided username.
         password (str): The provided password.
@@ -69,12 +167,73 @@ def verify_password(username, password):
     Returns:
         str: The username if the authentication succeeds, otherwise None.
     """
-    if username in users and check_password_hash(users.get(username), password):
+    users = get_users()
+    if username not in users:
+        return None
+
+    digest = hmac.new(verified_credentials_key, password.encode("utf-8"), hashlib.sha256).digest()
+    with verified_credentials_lock:
+        cached_digest = verified_credentials.get(username)
+    if cached_digest is not None and hmac.compare_digest(cached_digest, digest):
+        return username
+
+    if check_password_hash(users.get(username), password):
+        with verified_credentials_lock:
+            verified_credentials[username] = digest
         return username
     return None
 
-logging.basicConfig(level=logging.INFO)
+class BasicAuthMiddleware:
+    """
+    WSGI middleware that rejects requests to protected paths without valid
+    HTTP Basic Auth credentials before Flask routes them.
+
+    The `@auth.login_required` decorator on each resource is kept as a second
+    line of defense. Like that decorator, the middleware lets OPTIONS requests
+    through, since CORS preflight requests never carry credentials.
+
+    Attributes:
+        wsgi_app (callable): The wrapped WSGI application.
+        protected_paths (frozenset): The request paths that require authentication.
+    """
+    unauthorized_body = b"Unauthorized Access"
+
+    def __init__(self, wsgi_app, protected_paths):
+        self.wsgi_app = wsgi_app
+        self.protected_paths = frozenset(protected_paths)
+
+    def __call__(self, environ, start_response):
+        if (environ.get("PATH_INFO") in self.protected_paths
+                and environ.get("REQUEST_METHOD") != "OPTIONS"):
+            credentials = Authorization.from_header(environ.get("HTTP_AUTHORIZATION"))
+            if (credentials is None or credentials.type != "basic"
+                    or verify_password(credentials.username, credentials.password) is None):
+                start_response("401 UNAUTHORIZED", [
+                    ("Content-Type", "text/html; charset=utf-8"),
+                    ("Content-Length", str(len(self.unauthorized_body))),
+                    ("WWW-Authenticate", 'Basic realm="Authentication Required"'),
+                ])
+                return [self.unauthorized_body]
+        return self.wsgi_app(environ, start_response)
+
+# Log warnings and errors only, unless LOGLEVEL asks for more (e.g. LOGLEVEL=INFO)
+log_level = (os.environ.get("LOGLEVEL") or "WARNING").upper()
+log_level_known = isinstance(logging.getLevelName(log_level), int)
+logging.basicConfig(level=log_level if log_level_known else logging.WARNING)
 logger = logging.getLogger(__name__)
+if not log_level_known:
+    logger.warning("Unknown LOGLEVEL %s, using WARNING", log_level)
+
+# Badge output: "png" embeds a Base64 PNG image, "webp" a Base64 WebP image,
+# "svg" embeds SVG markup and "url" links to the /badge/<name>.png endpoint
+# (falling back to an embedded PNG for names that endpoint cannot serve)
+BADGE_FORMAT = os.environ.get("BADGE_FORMAT", "png").lower()
+if BADGE_FORMAT == "webp" and not WEBP_SUPPORTED:
+    logger.warning("WebP is not supported by this Pillow build, using PNG badges")
+    BADGE_FORMAT = "png"
+
+# Badge size grows with the name, and /badge/<name>.png is public, so names are capped
+MAX_NAME_LENGTH = 64
 
 class AgentRequest:
     """
@@ -96,6 +255,16 @@ class AgentResponse:
     def __init__(self, message):
         self.message = message
 
+    def __repr__(self):
+        """
+        Summarizes the response by message length, so logging it never writes
+        the full badge markup.
+
+        Returns:
+            str: A short description of the agent_response.
+        """
+        return f"AgentResponse(len={len(self.message)})"
+
     def to_dict(self):
         """
         Converts the agent_response object to a dictionary.
@@ -122,7 +291,62 @@ agent_response_model = api.model('AgentResponse', {
     )
 })
 
+def badge_lines(name):
+    """
+    Returns the two lines of text shown on the badge for a name.
+
+    Parameters:
+        name (str): The name from the agent request.
+
+    Returns:
+        tuple: The first and second lines of the badge.
+
+    Raises:
+        TypeError: If the name is not a string.
+        ValueError: If the name is longer than `MAX_NAME_LENGTH` characters.
+    """
+    if not isinstance(name, str):
+        raise TypeError("'name' must be a string")
+    if len(name) > MAX_NAME_LENGTH:
+        raise ValueError(f"'name' must be at most {MAX_NAME_LENGTH} characters")
+    return "Heroku Agent Action", f"Deployed by {name}"
+
 # API Routes
+@api.route('/badge/<string:name>.png')
+class Badge(Resource):
+    """
+    RESTful resource serving badges as PNG images that clients can cache.
+    """
+
+    @api.produces(['image/png'])
+    @api.response(200, 'Success')
+    @api.response(304, 'Not Modified')
+    @api.response(404, 'Badge links disabled or name too long')
+    def get(self, name):
+        """
+        Handles GET requests for the badge of a name.
+
+        Returns the PNG with long-lived caching headers and an ETag, or a 304
+        response if the client already has the same badge. The endpoint is not
+        authenticated, so it is only served when `BADGE_FORMAT` is `url`, and
+        names longer than `MAX_NAME_LENGTH` are not found.
+
+        Returns:
+            flask.Response: The PNG image response.
+        """
+        if BADGE_FORMAT != "url":
+            api.abort(404)
+        try:
+            lines = badge_lines(name)
+        except ValueError:
+            api.abort(404)
+        png_bytes = render_badge_png(*lines)
+        response = make_response(png_bytes)
+        response.mimetype = 'image/png'
+        response.headers['Cache-Control'] = 'public, max-age=86400, immutable'
+        response.set_etag(hashlib.sha1(png_bytes).hexdigest())
+        return response.make_conditional(request)
+
 @api.route('/process')
 class Process(Resource):
     """
@@ -130,7 +354,7 @@ class Process(Resource):
     """
 
     @auth.login_required  # Protect the endpoint with HTTP Basic Auth
-    @api.expect(agent_request_model)  # Use the model here    
+    @api.expect(agent_request_model, validate=False)  # Document only; the payload is checked below
     @api.response(200, 'Success', agent_response_model)  # Define the response model here
     def post(self):
         """
@@ -153,18 +377,37 @@ class Process(Resource):
         # Create MyRequest instance from JSON data
         agent_request = AgentRequest(data['name'])
         logger.info("Received query: %s", agent_request.name)
+
+        try:
+            line1, line2 = badge_lines(agent_request.name)
+        except (TypeError, ValueError) as e:
+            response = make_response(jsonify({"error": f"Invalid request, {e}"}))
+            response.status_code = 400
+            response.headers['Content-Type'] = 'application/json'
+            return response
         
         # Create badge and embed in HTML
         try:
-            base64_image = create_badge("Heroku Agent Action", f"Deployed by {agent_request.name}")
-            html_fragment = f'<img src="data:image/png;base64,{base64_image}">'
+            if BADGE_FORMAT == "svg":
+                html_fragment = create_badge_svg(line1, line2)
+            elif BADGE_FORMAT == "webp":
+                base64_image = pybase64.b64encode(render_badge_webp(line1, line2)).decode("ascii")
+                html_fragment = f'<img src="data:image/webp;base64,{base64_image}">'
+            elif BADGE_FORMAT == "url" and agent_request.name and "/" not in agent_request.name:
+                # Empty names and names with a slash cannot be routed, so they are embedded below
+                badge_url = api.url_for(Badge, name=agent_request.name, _external=True)
+                html_fragment = f'<img src="{html.escape(badge_url)}">'
+            else:
+                base64_image = create_badge(line1, line2)
+                html_fragment = f'<img src="data:image/png;base64,{base64_image}">'
             message = html_fragment
 
-            # Save debug.html with the generated image
-            debug_html = f"<body style='background: black'>{html_fragment}</body>"
-            with open("debug.html", "w") as debug_file:
-                debug_file.write(debug_html)
-                logger.info("Saved debug.html")
+            # Save debug.html with the generated image when enabled
+            if os.environ.get("DEBUG_HTML") == "1":
+                debug_html = f"<body style='background: black'>{html_fragment}</body>"
+                with open("debug.html", "w") as debug_file:
+                    debug_file.write(debug_html)
+                    logger.info("Saved debug.html")
         except Exception as e:
             logger.error("Error generating badge: %s", str(e))
             message = "Error generating badge"
@@ -173,10 +416,18 @@ class Process(Resource):
         logger.info("Result is: %s", agent_response)
         return agent_response.to_dict()
 
+# Trust the Heroku router's X-Forwarded-Proto header so external badge URLs use https;
+# the router does not set X-Forwarded-Host, so clients must not be able to choose the host
+app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1)
+
+# Reject unauthenticated requests before they reach Flask
+app.wsgi_app = BasicAuthMiddleware(app.wsgi_app, ["/process"])
+
 if __name__ == '__main__':
     """
     Entry point for the application. Starts the Flask server and runs the application.
     """
     # Use the PORT environment variable if present, otherwise default to 5000
     port = int(os.environ.get('PORT', 5000))
-    app.run(debug=True, host='0.0.0.0', port=port)
+    # The debugger and reloader are opt-in; production runs under Gunicorn (see Procfile)
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=port)
@@ -10,22 +10,41 @@ Functionality:
 - Dynamically generates a badge with customizable text lines.
 - Includes a logo at the top of the badge.
 - Adds a rotated text box with a shadow effect and text inside.
-- Outputs the badge as a Base64-encoded PNG string.
+- Outputs the badge as raw PNG or WebP bytes, a Base64-encoded PNG string, or SVG markup.
+- Caches recently generated badges, so repeated text is only rendered once.
 
 Dependencies:
 - Pillow (PIL): For image creation and manipulation.
-- base64: For encoding the badge image.
+- NumPy: For filling the text box and its shadow.
+- pybase64: For fast (SIMD) Base64 encoding of the badge image.
+- functools: For caching generated badges.
+- html: For escaping text in SVG badges.
 - io: For in-memory image handling.
 - math: For geometric calculations.
 - os: For file path operations.
+- threading: For per-thread output buffers.
 
 Functions:
     create_badge(line1: str, line2: str) -> str:
         Creates a badge with the specified text lines and returns it as a
         Base64-encoded PNG string.
 
+    render_badge_png(line1: str, line2: str) -> bytes:
+        Creates the same badge and returns the raw PNG bytes.
+
+    render_badge_webp(line1: str, line2: str) -> bytes:
+        Creates the same badge and returns raw lossless WebP bytes, when Pillow
+        supports WebP.
+
+    create_badge_svg(line1: str, line2: str) -> str:
+        Creates the same badge as SVG markup, leaving rasterization to the
+        browser.
+
+    clear_caches() -> None:
+        Clears the cached badges and resources, e.g. after changing the logo.
+
 Example Usage:
-    from badgecreator import create_badge
+    from badgecreator import create_badge, render_badge_png
 
     # Generate a badge with custom text
     badge_base64 = create_badge("Heroku Agent Action", "Deployed by Neo")
@@ -33,6 +52,9 @@ Example Usage:
     # Embed the badge in an HTML fragment
     html_fragment = f'<img src="data:image/png;base64,{badge_base64}">'
 
+    # Or use the raw PNG bytes, e.g. as an HTTP response body, skipping Base64
+    png_bytes = render_badge_png("Heroku Agent Action", "Deployed by Neo")
+
 Directory Structure:
     The module expects the following directory and file setup:
     - A `resources` directory containing a logo image (`heroku_logo.png`).
@@ -45,14 +67,137 @@ Error Handling:
 This module is designed to be integrated into other applications where badge
 generation and dynamic content embedding are required.
 """
-import base64
+import functools
+import html
 import io
 import math
 import os
+import threading
+
+import numpy as np
+import pybase64
+from PIL import Image, ImageDraw, ImageFont, features
+
+LOGO_PATH = os.path.join("resources", "heroku_logo.png")
+LOGO_WIDTH = 200
+FONT_PATH = "arial.ttf"  # Use the initial font (Arial Regular)
+FONT_SIZE = 20
+WEBP_SUPPORTED = features.check("webp")
+
+# Badge layout and colors
+BACKGROUND_COLOR = "white"
+TEXT_COLOR = "black"
+SHADOW_COLOR = (0, 0, 0, 128)  # Semi-transparent black for the shadow
+SHADOW_OFFSET = 5
+BOX_COLOR = (255, 255, 255, 255)
+BORDER_COLOR = (0, 0, 0, 255)
+BORDER_WIDTH = 2
+PADDING = 15
+BOX_PADDING_TOP_BOTTOM = 5  # Reduced padding at the top and bottom
+BOX_PADDING_SIDES = 10  # Keep the same padding on the sides
+BOX_WIDTH_STEP = 16  # Box widths are rounded up to this, so similar names share a template
+BOX_OVERLAP = 10  # How far the text box overlaps the bottom of the logo
+ROTATION_ANGLE = -10  # Tilt counter-clockwise like in the Java version
+
+# Pillow's affine transforms map output pixels back to input pixels, so the
+# inverse rotation is applied; rounded like Image.rotate rounds them
+_ROTATION_COS = round(math.cos(math.radians(ROTATION_ANGLE)), 15)
+_ROTATION_SIN = round(math.sin(math.radians(ROTATION_ANGLE)), 15)
+
+
+def _load_logo(logo_path: str, logo_width: int) -> Image.Image:
+    """
+    Loads the logo and resizes it to the given width, keeping its aspect ratio.
+
+    The logo is flattened onto the badge background color and returned in RGB
+    mode, so it can be pasted onto badges without alpha compositing.
+
+    Raises:
+        FileNotFoundError: If the logo image is not found at `logo_path`.
+    """
+    try:
+        logo = Image.open(logo_path).convert("RGBA")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Logo not found at {logo_path}")
+
+    aspect_ratio = logo.height / logo.width
+    logo_height = int(logo_width * aspect_ratio)
+    logo = logo.resize((logo_width, logo_height), Image.BILINEAR)
+
+    flattened_logo = Image.new("RGB", logo.size, BACKGROUND_COLOR)
+    flattened_logo.paste(logo, (0, 0), logo)
+    return flattened_logo
+
+
+def _load_font(font_path: str, font_size: int):
+    """
+    Loads the TrueType font, falling back to Pillow's default font.
+
+    TrueType fonts use Pillow's basic layout engine, even when libraqm is
+    installed. Badge text is short Latin text, so it does not need complex
+    shaping (kerning, ligatures) through HarfBuzz.
+    """
+    try:
+        return ImageFont.truetype(font_path, font_size, layout_engine=ImageFont.Layout.BASIC)
+    except IOError:
+        print("Warning: Arial font not found, using default font.")
+        font = ImageFont.load_default()  # Fallback to default font
+        if isinstance(font, ImageFont.FreeTypeFont):
+            font = font.font_variant(layout_engine=ImageFont.Layout.BASIC)
+        return font
+
+
+@functools.lru_cache(maxsize=1)
+def _get_logo() -> Image.Image:
+    """
+    Returns the resized logo, loading it on first use and sharing it afterwards.
+
+    Raises:
+        FileNotFoundError: If the logo image is not found in the expected path.
+    """
+    return _load_logo(LOGO_PATH, LOGO_WIDTH)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_font():
+    """
+    Returns the badge font with its ascent and line height, loading it on first
+    use and sharing it afterwards.
+
+    The line height (ascent plus descent) is the same for any text, so text
+    lines only need their width measured.
+    """
+    font = _load_font(FONT_PATH, FONT_SIZE)
+    if hasattr(font, "getmetrics"):
+        ascent, descent = font.getmetrics()
+        return font, ascent, ascent + descent
 
-from PIL import Image, ImageDraw, ImageFont
+    # Bitmap fonts have no metrics; measure a line with ascenders and descenders
+    line_height = font.getbbox("Ay")[3]
+    return font, line_height, line_height
 
 
+# Per-thread PNG output buffer, reused across badges. Its initial size covers
+# typical badges (around 17 KB), so encoding rarely has to grow it
+_buffers = threading.local()
+_OUTPUT_BUFFER_SIZE = 32 * 1024
+
+
+def _get_output_buffer() -> io.BytesIO:
+    """
+    Returns this thread's PNG output buffer, rewound to the start.
+
+    The buffer is not truncated, so its allocation is kept between badges;
+    callers must only read up to `tell()` after writing.
+    """
+    output = getattr(_buffers, "output", None)
+    if output is None:
+        output = _buffers.output = io.BytesIO(bytes(_OUTPUT_BUFFER_SIZE))
+    output.seek(0)
+    return output
+
+
+@functools.lru_cache(maxsize=256)
 def create_badge(line1: str, line2: str) -> str:
     """
         Generates a badge with a logo, rotated text box, and text.
@@ -75,118 +220,327 @@ def create_badge(line1: str, line2: str) -> str:
             badge_base64 = create_badge("Heroku Agent Action", "Deployed by Neo")
             html_fragment = f'<img src="data:image/png;base64,{badge_base64}">'
         """
-    # Paths and colors
-    logo_path = os.path.join("resources", "heroku_logo.png")
-    font_path = "arial.ttf"  # Use the initial font (Arial Regular)
-    background_color = "white"
-    text_color = "black"
-    shadow_color = (0, 0, 0, 128)  # Semi-transparent black for the shadow
-
-    # Load the logo
-    try:
-        logo = Image.open(logo_path).convert("RGBA")
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Logo not found at {logo_path}")
+    # Base64 output is always ASCII
+    return pybase64.b64encode(render_badge_png(line1, line2)).decode("ascii")
 
-    # Resize the logo
-    logo_width = 200
-    aspect_ratio = logo.height / logo.width
-    logo_height = int(logo_width * aspect_ratio)
-    logo = logo.resize((logo_width, logo_height))
 
-    # Font settings
-    font_size = 20
-    try:
-        font = ImageFont.truetype(font_path, font_size)
-    except IOError:
-        font = ImageFont.load_default()  # Fallback to default font
-        print("Warning: Arial font not found, using default font.")
+def clear_caches() -> None:
+    """
+        Clears all cached badges and resources.
 
-    # Calculate text dimensions using textbbox
-    temp_image = Image.new("RGBA", (1, 1))
-    temp_draw = ImageDraw.Draw(temp_image)
-    line1_bbox = temp_draw.textbbox((0, 0), line1, font=font)
-    line2_bbox = temp_draw.textbbox((0, 0), line2, font=font)
-    text_width = max(line1_bbox[2], line2_bbox[2])  # Use the width from bbox
-    text_height = (line1_bbox[3] - line1_bbox[1]) + (line2_bbox[3] - line2_bbox[1])  # Height of both lines
+        Call this after changing the logo, the font or the layout settings, so
+        that later badges are rendered from the new resources.
+        """
+    for cached in (
+        create_badge,
+        render_badge_png,
+        render_badge_webp,
+        create_badge_svg,
+        _badge_template,
+        _rotation_transform,
+        _logo_base64,
+        _get_logo,
+        _get_font,
+    ):
+        cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
+def render_badge_png(line1: str, line2: str) -> bytes:
+    """
+        Renders the badge described in `create_badge` as raw PNG bytes.
+
+        Results are cached by text, so repeated calls with the same lines return
+        the previously rendered badge.
+
+        Args:
+            line1 (str): The first line of text to include in the badge.
+            line2 (str): The second line of text to include in the badge.
+
+        Returns:
+            bytes: The PNG image of the generated badge.
+
+        Raises:
+            FileNotFoundError: If the logo image is not found in the expected path.
+
+        Example:
+            png_bytes = render_badge_png("Heroku Agent Action", "Deployed by Neo")
+        """
+    # Fast compression: the PNG is small and usually Base64-encoded straight away
+    return _encode_badge(_draw_badge(line1, line2), format="PNG", compress_level=1)
+
+
+@functools.lru_cache(maxsize=256)
+def render_badge_webp(line1: str, line2: str) -> bytes:
+    """
+        Renders the badge described in `create_badge` as raw lossless WebP bytes.
+
+        WebP encodes faster and smaller than PNG for this kind of image, but
+        needs Pillow built with WebP support (see `WEBP_SUPPORTED`). Results are
+        cached by text.
+
+        Args:
+            line1 (str): The first line of text to include in the badge.
+            line2 (str): The second line of text to include in the badge.
+
+        Returns:
+            bytes: The WebP image of the generated badge.
+
+        Raises:
+            FileNotFoundError: If the logo image is not found in the expected path.
+
+        Example:
+            webp_bytes = render_badge_webp("Heroku Agent Action", "Deployed by Neo")
+        """
+    # Method 0 is the fastest lossless encoder setting
+    return _encode_badge(_draw_badge(line1, line2), format="WEBP", lossless=True, method=0)
+
+
+def _encode_badge(badge: Image.Image, **save_options) -> bytes:
+    """
+    Encodes a badge image with the given `Image.save` options.
+    """
+    output = _get_output_buffer()
+    badge.save(output, **save_options)
+    # Copy out only what was written; the buffer is reused
+    with output.getbuffer() as image_view:
+        return image_view[:output.tell()].tobytes()
+
+
+def _draw_badge(line1: str, line2: str) -> Image.Image:
+    """
+    Draws the badge for the given text lines.
+
+    Only the text is drawn per badge; everything else comes from a copy of the
+    cached template for the text box size.
+    """
+    font, _, line_height = _get_font()
+
+    # Calculate text dimensions from the advance widths and the font's line height
+    line1_width = math.ceil(font.getlength(line1))
+    line2_width = math.ceil(font.getlength(line2))
+    text_width = max(line1_width, line2_width)
+    text_height = 2 * line_height  # Height of both lines
+
+    # Text box dimensions
+    box_width = _box_width(text_width)
+    box_height = text_height + 2 * BOX_PADDING_TOP_BOTTOM
+
+    template, tile_size, tile_position = _badge_template(box_width, box_height)
+    badge = template.copy()
+
+    # Draw the text as a single-band coverage mask laid out like the box tile,
+    # so it rotates onto the same place as the box; the text color is applied
+    # through the mask, so only one band is rotated instead of four
+    text_mask = Image.new("L", tile_size, 0)
+    text_draw = ImageDraw.Draw(text_mask)
+    text_x1 = (box_width - line1_width) // 2  # Center line 1
+    text_x2 = (box_width - line2_width) // 2  # Center line 2
+    text_y_start = BOX_PADDING_TOP_BOTTOM  # Adjusted for reduced padding
+    text_draw.text((text_x1, text_y_start), line1, fill=255, font=font)
+    text_draw.text((text_x2, text_y_start + line_height), line2, fill=255, font=font)
+
+    rotated_size, rotation = _rotation_transform(tile_size)
+    rotated_mask = text_mask.transform(rotated_size, Image.AFFINE, rotation, Image.BILINEAR)
+    badge.paste(TEXT_COLOR, tile_position, rotated_mask)
+
+    return badge
+
+
+def _box_width(text_width: int) -> int:
+    """
+    Returns the width of the text box for the given text width.
+
+    The padded width is rounded up to a multiple of `BOX_WIDTH_STEP`, so that
+    names of similar length get the same box and share a cached template.
+    """
+    return math.ceil((text_width + 2 * BOX_PADDING_SIDES) / BOX_WIDTH_STEP) * BOX_WIDTH_STEP
+
+
+@functools.lru_cache(maxsize=32)
+def _badge_template(box_width: int, box_height: int) -> tuple:
+    """
+    Renders a badge without text for the given text box size.
+
+    The logo, the shadow and the rotated empty box only depend on the size of
+    the text box, so they are rendered once per size and copied for each badge.
+    The box height is fixed by the font and widths are rounded by `_box_width`,
+    so 32 templates cover the usual name lengths. A template is an RGB image of
+    about 0.6 MB for the longest (64-character) names the app accepts, so the
+    cache holds at most about 20 MB.
+
+    Returns:
+        tuple: The template image, the size of the unrotated box tile, and the
+        position at which the rotated tile is pasted onto the badge.
+    """
+    logo = _get_logo()
+    logo_width, logo_height = logo.size
 
     # Badge dimensions
-    padding = 15
-    box_padding_top_bottom = 5  # Reduced padding at the top and bottom
-    box_padding_sides = 10  # Keep the same padding on the sides
-    box_width = text_width + 2 * box_padding_sides
-    box_height = text_height + 2 * box_padding_top_bottom
-    badge_width = max(box_width + 2 * padding, logo_width + 2 * padding)
-    dynamic_badge_height = logo_height + box_height + 2 * padding
-
-    # Create badge canvas
-    badge = Image.new("RGBA", (int(badge_width), int(dynamic_badge_height)), background_color)
-
-    # Place logo at the top
+    badge_width = max(box_width + 2 * PADDING, logo_width + 2 * PADDING)
+    dynamic_badge_height = logo_height + box_height + 2 * PADDING
+
+    # Create badge canvas; it is opaque, so RGB avoids a needless alpha band
+    badge = Image.new("RGB", (int(badge_width), int(dynamic_badge_height)), BACKGROUND_COLOR)
+
+    # Place logo at the top; it is already flattened, so no mask is needed
     logo_x = (badge_width - logo_width) // 2
-    logo_y = padding
-    badge.paste(logo, (int(logo_x), int(logo_y)), logo)
+    logo_y = PADDING
+    badge.paste(logo, (int(logo_x), int(logo_y)))
 
     # Calculate rotated box position (adjusted below the logo with minimal overlap)
     box_x = (badge_width - box_width) // 2
-    box_y = logo_y + logo_height - 10  # Adjusted positioning for minimal overlap
-    rotation_angle = -10  # Tilt counter-clockwise like in the Java version
-
-    # Expand the image to accommodate the rotated box
-    diagonal = int(math.sqrt(box_width**2 + box_height**2))
-    expanded_box_image = Image.new("RGBA", (diagonal, diagonal), (0, 0, 0, 0))
-    expanded_box_draw = ImageDraw.Draw(expanded_box_image)
-
-    # Center the box in the expanded image
-    box_center_x = diagonal // 2
-    box_center_y = diagonal // 2
-    box_origin = (
-        box_center_x - box_width // 2,
-        box_center_y - box_height // 2,
+    box_y = logo_y + logo_height - BOX_OVERLAP
+
+    # Draw the box and its shadow on a tile just large enough to hold them.
+    # Build the shadow and the white box with its 2px border as array slices,
+    # writing every pixel exactly once; the box edges are inclusive, as with
+    # ImageDraw.rectangle
+    tile_width = box_width + SHADOW_OFFSET + 1
+    tile_height = box_height + SHADOW_OFFSET + 1
+    box_pixels = np.empty((tile_height, tile_width, 4), dtype=np.uint8)
+    x1, y1 = box_width + 1, box_height + 1
+    box_pixels[:SHADOW_OFFSET, x1:] = 0  # Transparent top-right corner
+    box_pixels[y1:, :SHADOW_OFFSET] = 0  # Transparent bottom-left corner
+    box_pixels[SHADOW_OFFSET:, x1:] = SHADOW_COLOR  # Shadow right of the box
+    box_pixels[y1:, SHADOW_OFFSET:x1] = SHADOW_COLOR  # Shadow below the box
+    box_pixels[:BORDER_WIDTH, :x1] = BORDER_COLOR  # Top border
+    box_pixels[y1 - BORDER_WIDTH:y1, :x1] = BORDER_COLOR  # Bottom border
+    box_pixels[BORDER_WIDTH:y1 - BORDER_WIDTH, :BORDER_WIDTH] = BORDER_COLOR  # Left border
+    box_pixels[BORDER_WIDTH:y1 - BORDER_WIDTH, x1 - BORDER_WIDTH:x1] = BORDER_COLOR  # Right border
+    box_pixels[BORDER_WIDTH:y1 - BORDER_WIDTH, BORDER_WIDTH:x1 - BORDER_WIDTH] = BOX_COLOR
+    box_tile = Image.fromarray(box_pixels)
+
+    # Rotate the tile about its center into an image sized to fit it
+    rotated_size, rotation = _rotation_transform(box_tile.size)
+    rotated_box = box_tile.transform(rotated_size, Image.AFFINE, rotation, Image.BILINEAR)
+
+    # Paste the rotated box so that the box center stays in place. The tile
+    # center is offset from the box center by the shadow, so that offset is
+    # rotated along with the tile
+    offset_x = box_width // 2 - tile_width / 2
+    offset_y = box_height // 2 - tile_height / 2
+    rotated_offset_x = offset_x * _ROTATION_COS + offset_y * _ROTATION_SIN
+    rotated_offset_y = -offset_x * _ROTATION_SIN + offset_y * _ROTATION_COS
+    rotated_box_position = (
+        round(box_x + box_width // 2 - rotated_offset_x - rotated_box.width / 2),
+        round(box_y + box_height // 2 - rotated_offset_y - rotated_box.height / 2),
     )
+    badge.paste(rotated_box, rotated_box_position, rotated_box)
 
-    # Draw shadow
-    shadow_offset = 5
-    expanded_box_draw.rectangle(
-        [
-            (box_origin[0] + shadow_offset, box_origin[1] + shadow_offset),
-            (box_origin[0] + box_width + shadow_offset, box_origin[1] + box_height + shadow_offset),
-        ],
-        fill=shadow_color,
-    )
+    return badge, box_tile.size, rotated_box_position
 
-    # Draw white box with border
-    expanded_box_draw.rectangle(
-        [box_origin, (box_origin[0] + box_width, box_origin[1] + box_height)],
-        fill="white",
-        outline="black",
-        width=2,
-    )
 
-    # Draw text inside the box before rotation
-    text_x1 = box_origin[0] + (box_width - line1_bbox[2]) // 2  # Center line 1
-    text_x2 = box_origin[0] + (box_width - line2_bbox[2]) // 2  # Center line 2
-    text_y_start = box_origin[1] + box_padding_top_bottom  # Adjusted for reduced padding
-    expanded_box_draw.text((text_x1, text_y_start), line1, fill=text_color, font=font)
-    expanded_box_draw.text(
-        (text_x2, text_y_start + (line1_bbox[3] - line1_bbox[1])), line2, fill=text_color, font=font
-    )
+@functools.lru_cache(maxsize=32)
+def _rotation_transform(size: tuple) -> tuple:
+    """
+    Computes the affine transform that rotates a tile about its center.
 
-    # Rotate the expanded box
-    rotated_box = expanded_box_image.rotate(
-        rotation_angle, resample=Image.BICUBIC, center=(box_center_x, box_center_y)
-    )
+    This is the transform `Image.rotate(ROTATION_ANGLE, expand=True)` builds,
+    computed once per tile size so the box and the text mask share it and
+    each badge only pays for the resampling.
 
-    # Paste the rotated box onto the badge
-    rotated_box_position = (
-        int(box_x - (box_center_x - box_width // 2)),
-        int(box_y - (box_center_y - box_height // 2)),
-    )
-    badge.paste(rotated_box, rotated_box_position, rotated_box)
+    Args:
+        size (tuple): The width and height of the unrotated tile.
 
-    # Save badge as Base64-encoded string
+    Returns:
+        tuple: The size of the rotated image and the affine coefficients for
+        `Image.transform`.
+    """
+    width, height = size
+    # Inverse rotation about the tile center
+    a, b = _ROTATION_COS, -_ROTATION_SIN
+    d, e = _ROTATION_SIN, _ROTATION_COS
+    center_x, center_y = width / 2, height / 2
+    c = a * -center_x + b * -center_y + center_x
+    f = d * -center_x + e * -center_y + center_y
+
+    # Size the output to the bounding box of the rotated corners
+    corners_x, corners_y = zip(*(
+        (a * x + b * y + c, d * x + e * y + f)
+        for x, y in ((0, 0), (width, 0), (width, height), (0, height))
+    ))
+    rotated_width = math.ceil(max(corners_x)) - math.floor(min(corners_x))
+    rotated_height = math.ceil(max(corners_y)) - math.floor(min(corners_y))
+
+    # Shift the transform so the rotated tile is centered in the output
+    shift_x = -(rotated_width - width) / 2
+    shift_y = -(rotated_height - height) / 2
+    c, f = a * shift_x + b * shift_y + c, d * shift_x + e * shift_y + f
+
+    return (rotated_width, rotated_height), (a, b, c, d, e, f)
+
+
+@functools.lru_cache(maxsize=1)
+def _logo_base64() -> str:
+    """
+    Returns the resized logo as a Base64-encoded PNG, encoded once.
+    """
     with io.BytesIO() as output:
-        badge.save(output, format="PNG")
-        base64_image = base64.b64encode(output.getvalue()).decode("utf-8")
+        _get_logo().save(output, format="PNG")
+        return pybase64.b64encode(output.getbuffer()).decode("ascii")
 
-    return base64_image
+
+@functools.lru_cache(maxsize=256)
+def create_badge_svg(line1: str, line2: str) -> str:
+    """
+        Generates the badge as SVG markup instead of a rasterized PNG.
+
+        The layout matches `create_badge`: the logo at the top and a rotated,
+        shadowed text box below it. The text is measured with the badge font but
+        rendered by the browser, so no image is drawn, rotated or encoded per
+        call. Results are cached by text.
+
+        Args:
+            line1 (str): The first line of text to include in the badge.
+            line2 (str): The second line of text to include in the badge.
+
+        Returns:
+            str: An `<svg>` element that can be embedded directly in HTML.
+
+        Example:
+            html_fragment = create_badge_svg("Heroku Agent Action", "Deployed by Neo")
+        """
+    logo_width, logo_height = _get_logo().size
+    font, ascent, line_height = _get_font()
+
+    # Measure the text as create_badge does
+    text_width = math.ceil(max(font.getlength(line1), font.getlength(line2)))
+    text_height = 2 * line_height
+
+    # Badge dimensions
+    box_width = _box_width(text_width)
+    box_height = text_height + 2 * BOX_PADDING_TOP_BOTTOM
+    badge_width = max(box_width + 2 * PADDING, logo_width + 2 * PADDING)
+    badge_height = logo_height + box_height + 2 * PADDING
+
+    logo_x = (badge_width - logo_width) // 2
+    logo_y = PADDING
+    box_x = (badge_width - box_width) // 2
+    box_y = logo_y + logo_height - BOX_OVERLAP
+    center_x = box_x + box_width / 2
+    center_y = box_y + box_height / 2
+
+    # SVG text is positioned by its baseline rather than its top edge
+    text_y1 = box_y + BOX_PADDING_TOP_BOTTOM + ascent
+    text_y2 = text_y1 + line_height
+    shadow_opacity = SHADOW_COLOR[3] / 255
+    font_size = getattr(font, "size", FONT_SIZE)  # The fallback font may differ
+
+    # SVG rotates clockwise for positive angles, Pillow counter-clockwise
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{badge_width}" height="{badge_height}">'
+        f'<rect width="100%" height="100%" fill="{BACKGROUND_COLOR}"/>'
+        f'<image href="data:image/png;base64,{_logo_base64()}" x="{logo_x}" y="{logo_y}" '
+        f'width="{logo_width}" height="{logo_height}"/>'
+        f'<g transform="rotate({-ROTATION_ANGLE} {center_x} {center_y})">'
+        f'<rect x="{box_x + SHADOW_OFFSET}" y="{box_y + SHADOW_OFFSET}" width="{box_width}" '
+        f'height="{box_height}" fill="black" fill-opacity="{shadow_opacity:.2f}"/>'
+        f'<rect x="{box_x}" y="{box_y}" width="{box_width}" height="{box_height}" '
+        f'fill="white" stroke="black" stroke-width="{BORDER_WIDTH}"/>'
+        f'<g font-family="Arial, Helvetica, sans-serif" font-size="{font_size}" '
+        f'fill="{TEXT_COLOR}" text-anchor="middle">'
+        f'<text x="{center_x}" y="{text_y1}">{html.escape(line1)}</text>'
+        f'<text x="{center_x}" y="{text_y2}">{html.escape(line2)}</text>'
+        f'</g></g></svg>'
+    )
@@ -69,6 +69,25 @@ def test_process_endpoint_success(client, valid_auth_headers):
     assert '<img src="data:image/png;base64' in response.json["message"], \
         "Response message does not contain a Base64 badge"
 
+def test_process_endpoint_svg(client, valid_auth_headers, monkeypatch):
+    """
+    Test the `/process` endpoint with SVG badges enabled.
+
+    Verifies that the endpoint returns an SVG badge when `BADGE_FORMAT` is `svg`.
+    """
+    import app as app_module
+
+    monkeypatch.setattr(app_module, "BADGE_FORMAT", "svg")
+    payload = {"name": "Neo"}
+    response = client.post("/process",
+                           data=json.dumps(payload),
+                           headers=valid_auth_headers,
+                           content_type="application/json"
+                           )
+
+    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+    assert response.json["message"].startswith("<svg"), "Response message does not contain an SVG badge"
+
 def test_process_endpoint_missing_name(client, valid_auth_headers):
     """
     Test the `/process` endpoint with missing 'name' field.
@@ -96,6 +115,40 @@ def test_process_endpoint_missing_name(client, valid_auth_headers):
         print("Response could not be parsed as JSON: ", response.data.decode())
         raise AssertionError("Failed to parse JSON response") from e
 
+def test_process_endpoint_name_too_long(client, valid_auth_headers):
+    """
+    Test the `/process` endpoint with a name longer than the badge allows.
+
+    Verifies that the endpoint returns a 400 status code instead of rendering the badge.
+    """
+    payload = {"name": "N" * 65}
+    response = client.post("/process",
+                           data=json.dumps(payload),
+                           headers=valid_auth_headers,
+                           content_type="application/json"
+                           )
+
+    assert response.status_code == 400, f"Unexpected status code: {response.status_code}"
+    assert response.get_json().get("error") == "Invalid request, 'name' must be at most 64 characters", \
+        f"Unexpected error message: {response.get_json()}"
+
+def test_process_endpoint_name_not_string(client, valid_auth_headers):
+    """
+    Test the `/process` endpoint with a 'name' field that is not a string.
+
+    Verifies that the endpoint returns a 400 status code and an appropriate error message.
+    """
+    for name in (123, None):
+        response = client.post("/process",
+                               data=json.dumps({"name": name}),
+                               headers=valid_auth_headers,
+                               content_type="application/json"
+                               )
+
+        assert response.status_code == 400, f"Unexpected status code: {response.status_code}"
+        assert response.get_json().get("error") == "Invalid request, 'name' must be a string", \
+            f"Unexpected error message: {response.get_json()}"
+
 def test_process_endpoint_invalid_auth(client, invalid_auth_headers):
     """
     Test the '/process' endpoint with invalid credentials.
@@ -110,4 +163,156 @@ def test_process_endpoint_invalid_auth(client, invalid_auth_headers):
                            )
 
     assert response.status_code == 401, f"Unexpected status code: {response.status_code}"
-    assert "Unauthorized" in response.data.decode(), "Expected unauthorized access error"
\ No newline at end of file
+    assert "Unauthorized" in response.data.decode(), "Expected unauthorized access error"
+
+def test_verify_password_caches_successful_checks(monkeypatch):
+    """
+    Test that a successful credential check is cached.
+
+    Verifies that a repeat request with the same credentials does not re-run
+    the password hash check, while a wrong password is still rejected.
+    """
+    import app as app_module
+
+    app_module.verified_credentials.clear()
+    assert app_module.verify_password("heroku", "agent") == "heroku"
+
+    def fail_check(*args):
+        raise AssertionError("Password hash should not be checked again")
+
+    monkeypatch.setattr(app_module, "check_password_hash", fail_check)
+    assert app_module.verify_password("heroku", "agent") == "heroku"
+
+    monkeypatch.setattr(app_module, "check_password_hash", lambda *args: False)
+    assert app_module.verify_password("heroku", "wrong") is None
+
+def test_process_endpoint_missing_auth(client):
+    """
+    Test the '/process' endpoint without credentials.
+
+    Verifies that the authentication middleware returns a 401 status code and a
+    Basic Auth challenge.
+    """
+    payload = {"name": "Neo"}
+    response = client.post("/process",
+                           data=json.dumps(payload),
+                           content_type="application/json"
+                           )
+
+    assert response.status_code == 401, f"Unexpected status code: {response.status_code}"
+    assert response.headers.get("WWW-Authenticate", "").startswith("Basic"), \
+        "Expected a Basic Auth challenge"
+
+def test_process_endpoint_options_without_auth(client):
+    """
+    Test a CORS preflight `OPTIONS` request to the '/process' endpoint without credentials.
+
+    Verifies that the authentication middleware lets the request through, as
+    `@auth.login_required` does, since preflight requests never carry credentials.
+    """
+    response = client.options("/process")
+
+    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+    assert "WWW-Authenticate" not in response.headers, "Preflight should not be challenged"
+
+def test_agent_response_repr():
+    """
+    Test that the `AgentResponse` representation only includes the message length.
+
+    Verifies that logging a response does not write the full badge markup.
+    """
+    from app import AgentResponse
+
+    message = '<img src="data:image/png;base64,' + "A" * 1000 + '">'
+    assert repr(AgentResponse(message)) == f"AgentResponse(len={len(message)})"
+    assert str(AgentResponse(message)) == repr(AgentResponse(message))
+
+def test_badge_endpoint_disabled(client):
+    """
+    Test the `/badge/<name>.png` endpoint with the default `BADGE_FORMAT`.
+
+    Verifies that the unauthenticated endpoint is not served unless badge links
+    are enabled.
+    """
+    response = client.get("/badge/Neo.png")
+
+    assert response.status_code == 404, f"Unexpected status code: {response.status_code}"
+
+def test_badge_endpoint_caching(client, monkeypatch):
+    """
+    Test the `/badge/<name>.png` endpoint and its HTTP caching headers.
+
+    Verifies that the endpoint returns a PNG with an ETag, and a 304 status code
+    when the client already has the same badge.
+    """
+    import app as app_module
+
+    monkeypatch.setattr(app_module, "BADGE_FORMAT", "url")
+    response = client.get("/badge/Neo.png")
+
+    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+    assert response.content_type == "image/png", "Badge should be a PNG image"
+    assert response.data.startswith(b"\x89PNG"), "Badge should be a PNG image"
+    assert "max-age=86400" in response.headers.get("Cache-Control", ""), "Badge should be cacheable"
+
+    etag = response.headers.get("ETag")
+    assert etag, "Badge response should have an ETag"
+    response = client.get("/badge/Neo.png", headers={"If-None-Match": etag})
+    assert response.status_code == 304, f"Unexpected status code: {response.status_code}"
+
+def test_badge_endpoint_name_too_long(client, monkeypatch):
+    """
+    Test the `/badge/<name>.png` endpoint with a name longer than the badge allows.
+
+    Verifies that the endpoint returns a 404 status code instead of rendering the badge.
+    """
+    import app as app_module
+
+    monkeypatch.setattr(app_module, "BADGE_FORMAT", "url")
+    response = client.get("/badge/" + "N" * 64 + ".png")
+    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+
+    response = client.get("/badge/" + "N" * 65 + ".png")
+    assert response.status_code == 404, f"Unexpected status code: {response.status_code}"
+
+def test_process_endpoint_badge_url(client, valid_auth_headers, monkeypatch):
+    """
+    Test the `/process` endpoint with badge links enabled.
+
+    Verifies that the endpoint links to the `/badge/<name>.png` endpoint when
+    `BADGE_FORMAT` is `url`.
+    """
+    import app as app_module
+
+    monkeypatch.setattr(app_module, "BADGE_FORMAT", "url")
+    payload = {"name": "Neo"}
+    response = client.post("/process",
+                           data=json.dumps(payload),
+                           headers=valid_auth_headers,
+                           content_type="application/json"
+                           )
+
+    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+    assert response.json["message"] == '<img src="http://localhost/badge/Neo.png">', \
+        f"Unexpected message: {response.json['message']}"
+
+def test_process_endpoint_badge_url_unroutable_name(client, valid_auth_headers, monkeypatch):
+    """
+    Test the `/process` endpoint with badge links enabled and a name containing a slash.
+
+    Verifies that the endpoint embeds the PNG badge instead of linking to a
+    `/badge/<name>.png` URL that would not be found.
+    """
+    import app as app_module
+
+    monkeypatch.setattr(app_module, "BADGE_FORMAT", "url")
+    payload = {"name": "a/b"}
+    response = client.post("/process",
+                           data=json.dumps(payload),
+                           headers=valid_auth_headers,
+                           content_type="application/json"
+                           )
+
+    assert response.status_code == 200, f"Unexpected status code: {response.status_code}"
+    assert response.json["message"].startswith('<img src="data:image/png;base64,'), \
+        f"Unexpected message: {response.json['message'][:100]}"
@@ -5,11 +5,13 @@ This file contains tests to validate the functionality of the `create_badge` fun
 ensuring it works correctly for valid inputs and handles errors gracefully.
 """
 
+import base64
 import os
 
 import pytest
 
-from badgecreator import create_badge
+import badgecreator
+from badgecreator import _load_logo, create_badge, create_badge_svg, render_badge_png, render_badge_webp
 
 LOGO_PATH = os.path.join("resources", "heroku_logo.png")
 
@@ -35,17 +37,81 @@ def test_create_badge_success(setup_environment):
     assert isinstance(badge, str), "Badge should be a Base64-encoded string"
     assert badge.startswith("iVBORw0KGgo"), "Badge should be a Base64-encoded string"
 
-def test_create_badge_invalid_logo_path(monkeypatch):
+def test_create_badge_cached(setup_environment):
+    """
+    Test that repeated badge creation is served from the cache.
+
+    Verifies that `create_badge` returns the cached string for repeated text, and
+    renders it again after `clear_caches`.
+    """
+    badge = create_badge("Cached line 1", "Cached line 2")
+
+    assert create_badge("Cached line 1", "Cached line 2") is badge, "Repeated text should hit the cache"
+
+    badgecreator.clear_caches()
+    rendered = create_badge("Cached line 1", "Cached line 2")
+
+    assert rendered is not badge, "Clearing the caches should render the badge again"
+    assert rendered == badge, "Rendering again should produce the same badge"
+
+def test_render_badge_png_success(setup_environment):
+    """
+    Test successful raw PNG badge creation with valid input.
+
+    Verifies that the `render_badge_png` function returns PNG bytes, and that
+    `create_badge` returns the same image Base64-encoded.
+    """
+    badge = render_badge_png("Test line 1", "Test line 2")
+
+    assert isinstance(badge, bytes), "Badge should be raw bytes"
+    assert badge.startswith(b"\x89PNG\r\n\x1a\n"), "Badge should be a PNG image"
+    assert base64.b64decode(create_badge("Test line 1", "Test line 2")) == badge, \
+        "create_badge should Base64-encode the raw PNG"
+
+def test_create_badge_svg_success(setup_environment):
+    """
+    Test successful SVG badge creation with valid input.
+
+    Verifies that the `create_badge_svg` function returns SVG markup containing the
+    escaped text lines.
+    """
+    badge = create_badge_svg("Test line 1", "Deployed by <Neo>")
+
+    assert badge.startswith("<svg"), "Badge should be SVG markup"
+    assert "Test line 1" in badge, "Badge should contain the first line"
+    assert "Deployed by &lt;Neo&gt;" in badge, "Badge text should be escaped"
+
+@pytest.mark.skipif(not badgecreator.WEBP_SUPPORTED, reason="Pillow is built without WebP support")
+def test_render_badge_webp_success(setup_environment):
+    """
+    Test successful WebP badge creation with valid input.
+
+    Verifies that the `render_badge_webp` function returns a WebP image.
+    """
+    badge = render_badge_webp("Test line 1", "Test line 2")
+
+    assert badge[:4] == b"RIFF" and badge[8:12] == b"WEBP", "Badge should be a WebP image"
+
+def test_load_logo_invalid_logo_path():
     """
     Test error handling for a missing logo file.
 
-    Simulates an invalid logo file path to ensure the `create_badge` function raises a
+    Uses an invalid logo file path to ensure the logo loader raises a
     `FileNotFoundError`.
     """
-    def mock_join(*args):
-        return "invalid/path/to/heroku_logo.png"
+    with pytest.raises(FileNotFoundError):
+        _load_logo("invalid/path/to/heroku_logo.png", 200)
+
+
+def test_create_badge_invalid_logo_path(monkeypatch):
+    """
+    Test error handling for a missing logo file when creating a badge.
 
-    monkeypatch.setattr(os.path, "join", mock_join)
+    Simulates an invalid logo file path to ensure the `create_badge` function raises a
+    `FileNotFoundError`.
+    """
+    monkeypatch.setattr(badgecreator, "LOGO_PATH", "invalid/path/to/heroku_logo.png")
+    badgecreator.clear_caches()
 
     with pytest.raises(FileNotFoundError):
-        create_badge("Test line 1", "Test line 2")
\ No newline at end of file
+        create_badge("Test line 1", "Test line 2")